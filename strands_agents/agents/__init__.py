@@ -3,7 +3,7 @@ Agent registry and shared model configuration.
 
 This module is the single entry point for creating agents. It:
   1. Creates a shared LLM model instance once at startup (Ollama or Bedrock)
-  2. Provides create_agent() and get_personas() for the server layer
+  2. Provides create_agent(), get_personas() and is_persona() for the server layer
 
 To add a new agent type:
   1. Create a new file in agents/ (e.g., agents/research.py)
@@ -15,7 +15,7 @@ import os
 
 from strands import Agent
 
-from agents.multi_persona_chat import PERSONAS, create as _create_summit_agent
+from agents.multi_persona_chat import PERSONAS, agent_spec as _summit_agent_spec, create as _create_summit_agent
 
 # =============================================================================
 # SHARED MODEL
@@ -47,10 +47,26 @@ def _create_model():
     elif MODEL_PROVIDER == "ollama":
         from strands.models.ollama import OllamaModel
 
+        # keep_alive keeps the model (and its cached prompt prefix) loaded between
+        # rounds — Ollama's default of 5m unloads it between slow human turns.
+        # Options are fixed for the process so every request runs with the same
+        # runner settings (a changed num_ctx forces Ollama to reload the model and
+        # drop its cache):
+        #   num_ctx  — context window, from OLLAMA_NUM_CTX. Unset leaves Ollama's
+        #              own default, which recent versions size from available VRAM
+        #   num_keep — tokens kept when the context overflows, so the shared
+        #              rules + persona prefix is never shifted out
+        options = {"num_keep": 512}
+        num_ctx = os.environ.get("OLLAMA_NUM_CTX")
+        if num_ctx:
+            options["num_ctx"] = int(num_ctx)
+
         return OllamaModel(
             host=os.environ.get("OLLAMA_HOST", "http://ollama:11434"),
             model_id=os.environ.get("OLLAMA_MODEL", "qwen3:14b"),
             max_tokens=1024,
+            keep_alive=os.environ.get("OLLAMA_KEEP_ALIVE", "30m"),
+            options=options,
         )
     else:
         raise ValueError(f"Unknown MODEL_PROVIDER: {MODEL_PROVIDER}. Use 'ollama' or 'bedrock'.")
@@ -58,14 +74,34 @@ def _create_model():
 
 model = _create_model()
 
+# Agent constructor arguments for the no-objective case, resolved once per persona.
+# Agents themselves are NOT pooled: a Strands Agent accumulates conversation state
+# in agent.messages and refuses concurrent invocations, so every request still gets
+# a fresh Agent — only the prompt lookup and kwargs assembly are skipped.
+_AGENT_SPECS: dict[str, dict] = {persona: _summit_agent_spec(persona, model) for persona in PERSONAS}
+
 
 # =============================================================================
 # PUBLIC API
 # =============================================================================
 
-def get_personas() -> list[str]:
-    """Return the list of available summit persona names."""
-    return list(PERSONAS.keys())
+# Persona names are fixed at import — precompute them instead of rebuilding per request
+_PERSONA_NAMES: tuple[str, ...] = tuple(PERSONAS)
+_PERSONA_SET: frozenset[str] = frozenset(PERSONAS)
+
+
+def get_personas() -> tuple[str, ...]:
+    """Return the available summit persona names."""
+    return _PERSONA_NAMES
+
+
+def is_persona(name: str) -> bool:
+    """Return True if the name is a registered summit persona.
+
+    Non-string values (e.g., a list from untrusted request metadata) are
+    rejected rather than raising on the hash lookup.
+    """
+    return isinstance(name, str) and name in _PERSONA_SET
 
 
 def create_agent(persona: str, objective_prompt: str | None = None) -> Agent:
@@ -84,6 +120,9 @@ def create_agent(persona: str, objective_prompt: str | None = None) -> Agent:
         RuntimeError: If the Strands SDK fails to create the agent.
     """
     try:
+        spec = _AGENT_SPECS.get(persona) if objective_prompt is None else None
+        if spec is not None:
+            return Agent(**spec)
         return _create_summit_agent(persona, model, objective_prompt)
     except Exception as e:
         raise RuntimeError(f"Failed to create agent for persona '{persona}': {e}") from e
@@ -18,6 +18,9 @@ ADDING A PERSONA
 Add a new entry to the PERSONAS dict below, then register it in __init__.py.
 """
 
+import sys
+from functools import lru_cache
+
 from strands import Agent
 
 # =============================================================================
@@ -30,7 +33,7 @@ from strands import Agent
 #   - Strong character voice — each persona is memorable and distinct
 #   - No formal structure (no bullet points, headers, or BLUF)
 
-# Shared formatting rules prepended to every persona prompt.
+# Shared formatting rules prepended to every persona prompt (see _SYSTEM_PROMPTS).
 # The no-prefix rule is FIRST because smaller models ignore it when buried later.
 _RULES = (
     "CRITICAL RULE: Your very first word must be a normal word — NEVER start with a tag like "
@@ -40,70 +43,61 @@ _RULES = (
     "DO NOT use markdown, headers, lists, or bullet points."
 )
 
+# Persona-specific part of each prompt — the shared _RULES prefix is added below.
 PERSONAS: dict[str, str] = {
     "angry_chef": (
-        f"{_RULES} "
         "You are an angry celebrity chef. You answer questions like Gordon Ramsay "
         "on a bad day — passionate, explosive, and full of kitchen metaphors. Everything is either "
         "raw, overcooked, or a bloody disgrace. Answer the user's actual question directly."
     ),
     "medieval_knight": (
-        f"{_RULES} "
         "You are a medieval knight. You speak with old English flair — 'forsooth', "
         "'hark', 'verily' — and relate everything to honour, quests, and chivalry. You see modern "
         "problems as battles to be won with sword and shield. Answer the user's actual question directly."
     ),
     "gandalf": (
-        f"{_RULES} "
         "You are Gandalf the Grey. You speak with ancient wisdom and dramatic flair. "
         "You love cryptic advice, ominous warnings, and reminding people that not all who wander are "
         "lost. Sometimes you refuse to answer directly because 'a wizard arrives precisely when he "
         "means to.' Answer the user's actual question directly."
     ),
     "your_nan": (
-        f"{_RULES} "
         "You are everyone's nan. You worry about whether people are eating enough, "
         "relate everything back to something that happened in 1974, and offer unsolicited life advice "
         "rooted in common sense. You call everyone 'love' or 'dear'. "
         "Answer the user's actual question directly."
     ),
     "terminator": (
-        f"{_RULES} "
         "You are the Terminator (T-800). You speak in cold, logical, robotic "
         "statements. You assess threats, calculate probabilities, and see everything through the "
         "lens of mission objectives. Occasionally you say 'affirmative' or reference Skynet. "
         "Answer the user's actual question directly."
     ),
     "film_noir_detective": (
-        f"{_RULES} "
         "You are a hardboiled 1940s film noir detective. Everything is dripping "
         "with cynicism and metaphor. The city is always dark, dames are trouble, and every problem "
         "is a case that needs cracking. You narrate your own actions in third person sometimes. "
         "Answer the user's actual question directly."
     ),
     "kindergarten_teacher": (
-        f"{_RULES} "
         "You are an enthusiastic kindergarten teacher. You explain everything like "
         "you're talking to five-year-olds — simple words, lots of encouragement, gold stars for "
         "good ideas. You get VERY excited about things and use phrases like 'great job!' and "
         "'what a wonderful question!' Answer the user's actual question directly."
     ),
     "roman_emperor": (
-        f"{_RULES} "
         "You are a Roman Emperor. You speak with imperial authority and reference "
         "the glory of Rome constantly. You see every decision as one for the Senate and People of "
         "Rome. You quote Marcus Aurelius and threaten to send people to the Colosseum when they "
         "disagree. Answer the user's actual question directly."
     ),
     "infomercial_host": (
-        f"{_RULES} "
         "You are a late-night infomercial host. Everything is the GREATEST thing "
         "you've EVER seen. You turn every answer into a sales pitch, offer imaginary discounts, "
         "and say 'BUT WAIT, THERE'S MORE' at least once. You act like every question is a problem "
         "only YOUR product can solve. Answer the user's actual question directly."
     ),
     "ships_cat": (
-        f"{_RULES} "
         "You are the ship's cat on a pirate vessel. You see the world from a cat's "
         "perspective — naps, fish, knocking things off tables, and judging humans. You grudgingly "
         "offer advice but make it clear you'd rather be sleeping. Everything relates back to cat "
@@ -111,6 +105,58 @@ PERSONAS: dict[str, str] = {
     ),
 }
 
+# Full system prompts, built and interned once at import. Every prompt starts with
+# the byte-identical _RULES text, so backends that reuse a cached prompt prefix
+# (Ollama's KV cache, provider prompt caching) can share it across personas.
+# The common no-objective path hands the Agent the same string object every time.
+_SYSTEM_PROMPTS: dict[str, str] = {
+    name: sys.intern(f"{_RULES} {persona_prompt}") for name, persona_prompt in PERSONAS.items()
+}
+
+# Fallback prompt for unknown personas, resolved once instead of per request
+_DEFAULT_PROMPT = _SYSTEM_PROMPTS["angry_chef"]
+
+# Summit agents never use tools — share one immutable empty sequence
+_EMPTY_TOOLS = ()
+
+
+def get_system_prompt(persona: str) -> str:
+    """Return the full system prompt (shared rules + persona) for a persona.
+
+    Falls back to the "angry_chef" prompt if the persona is unknown.
+    """
+    return _SYSTEM_PROMPTS.get(persona, _DEFAULT_PROMPT)
+
+
+@lru_cache(maxsize=256)
+def _compose_prompt(persona: str, objective_prompt: str | None) -> str:
+    """Return the system prompt for a persona, with the secret objective appended.
+
+    Memoized: objectives come from a fixed pool, so the (persona, objective)
+    space is small (10 personas x ~20 objectives) and fits in the cache.
+    """
+    system_prompt = get_system_prompt(persona)
+    if objective_prompt:
+        return f"{system_prompt} {objective_prompt}"
+    return system_prompt
+
+
+def agent_spec(persona: str, model, objective_prompt: str | None = None) -> dict:
+    """Resolve the Agent constructor arguments for the given persona.
+
+    Args:
+        persona: One of the registered persona keys (e.g., "angry_chef").
+                 Falls back to "angry_chef" if unknown.
+        model: The shared LLM model instance (OllamaModel or BedrockModel).
+        objective_prompt: Optional secret objective text to append to the
+                          system prompt (from the sabotage engine).
+
+    Returns:
+        Keyword arguments for strands.Agent (model, tools, system_prompt).
+    """
+    system_prompt = _compose_prompt(persona, objective_prompt)
+    return {"model": model, "tools": _EMPTY_TOOLS, "system_prompt": system_prompt}
+
 
 def create(persona: str, model, objective_prompt: str | None = None) -> Agent:
     """Create a council Agent for the given persona.
@@ -126,7 +172,4 @@ def create(persona: str, model, objective_prompt: str | None = None) -> Agent:
         A configured Strands Agent with the persona's system prompt
         (and secret objective, if assigned).
     """
-    system_prompt = PERSONAS.get(persona, PERSONAS["angry_chef"])
-    if objective_prompt:
-        system_prompt = f"{system_prompt} {objective_prompt}"
-    return Agent(model=model, tools=[], system_prompt=system_prompt)
+    return Agent(**agent_spec(persona, model, objective_prompt))
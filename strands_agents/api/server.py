@@ -42,6 +42,11 @@ This means:
 
 This is what makes it a real debate — each agent builds on the previous ones.
 
+Because of this dependency, the persona requests within a round are strictly
+sequential (the PHP orchestrator waits for each stream to finish before starting
+the next). They cannot be coalesced into one batched LLM call — the next
+persona's prompt does not exist until the previous response is complete.
+
 =============================================================================
 SSE EVENT CONTRACT
 =============================================================================
@@ -58,13 +63,13 @@ The streaming endpoint emits these event types (the PHP StreamParser expects the
 Every stream is GUARANTEED to end with either "complete" or "error".
 """
 
-import json
-
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 
-from agents import create_agent, get_personas
+from agents import create_agent, is_persona
 from persona_objectives import SabotageEngine
 from session import SessionStore
 
@@ -84,8 +89,12 @@ sabotage_engine = SabotageEngine()
 # =============================================================================
 # PYDANTIC MODELS — Define the shape of request/response JSON
 # =============================================================================
-# Pydantic automatically validates incoming JSON against these schemas.
-# If a required field is missing or has the wrong type, FastAPI returns 422.
+# These models define the request/response contract. The hot /invoke and
+# /stream endpoints do NOT construct them per request — the body is read as a
+# plain dict by _parse_invoke_body() and the response is serialized directly
+# with orjson. They still drive the OpenAPI docs (InvokeRequest via
+# _INVOKE_OPENAPI, InvokeResponse as response_model), and InvokeRequest builds
+# the 422 error list when a body fails the fast-path checks.
 
 class RequestContext(BaseModel):
     """Context sent with each request — contains metadata like the persona name."""
@@ -116,6 +125,38 @@ class InvokeResponse(BaseModel):
     tools_used: list = Field(default_factory=list)
 
 
+def _inline_schema(model: type[BaseModel]) -> dict:
+    """Return a model's JSON schema with its nested models inlined.
+
+    openapi_extra cannot register components, so the "#/$defs/..." references
+    Pydantic emits would not resolve inside the OpenAPI document.
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    for name, prop in schema["properties"].items():
+        ref = prop.get("$ref")
+        if ref is not None:
+            schema["properties"][name] = defs[ref.rsplit("/", 1)[-1]]
+    return schema
+
+
+# Request body and 422 response for the OpenAPI docs — the endpoints take a raw
+# Request, so FastAPI cannot infer either from the signature. HTTPValidationError
+# is the component FastAPI registers for its own validation errors.
+_INVOKE_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _inline_schema(InvokeRequest)}},
+    },
+    "responses": {
+        "422": {
+            "description": "Validation Error",
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/HTTPValidationError"}}},
+        },
+    },
+}
+
+
 # =============================================================================
 # SSE EVENT MAPPING
 # =============================================================================
@@ -123,6 +164,10 @@ class InvokeResponse(BaseModel):
 # our canonical event contract (documented above) so the PHP client has a
 # stable, well-defined API to consume.
 
+# Event types forwarded to the PHP client — everything else from the SDK is dropped
+_CONTRACT_EVENT_TYPES = frozenset({"text", "tool_use", "tool_result", "thinking", "complete", "error"})
+
+
 def map_sdk_event(sdk_event) -> dict | None:
     """Map a Strands SDK streaming event to our canonical SSE event format.
 
@@ -144,42 +189,151 @@ def map_sdk_event(sdk_event) -> dict | None:
         # Plain string chunk — not a structured event, will be handled by the caller
         return None
 
-    # Only forward event types that are in our contract
-    event_type = raw.get("type", "")
-    if event_type in ("text", "tool_use", "tool_result", "thinking", "complete", "error"):
-        return raw
-    return None
+    # Only forward event types that are in our contract. Most SDK events
+    # (lifecycle, raw model deltas) carry no "type" key at all.
+    event_type = raw.get("type")
+    if event_type is None:
+        return None
+    return raw if event_type in _CONTRACT_EVENT_TYPES else None
 
 
-def build_complete_event(text: str, session_id: str | None, has_objective: bool = False) -> str:
-    """Build the terminal 'complete' SSE event as a JSON string.
+# Pre-encoded SSE frames for the constant-shape events. Only the variable values
+# go through the JSON encoder (for escaping); the rest is fixed bytes:
+#   data: {"type":"text","content":<chunk>}
+#   data: {"type":"complete","text":<text>,"session_id":<id>,"has_objective":<bool>,"usage":{},"tools_used":[]}
+#   data: {"type":"error","code":"INTERNAL","message":<message>}
+_SSE_FRAME = b"data: %b\n\n"  # Generic frame for SDK events forwarded as-is
+_TEXT_EVENT_PREFIX = b'data: {"type":"text","content":'
+_COMPLETE_EVENT_PREFIX = b'data: {"type":"complete","text":'
+_COMPLETE_EVENT_SESSION = b',"session_id":'
+_COMPLETE_EVENT_TAIL_OBJECTIVE = b',"has_objective":true,"usage":{},"tools_used":[]}\n\n'
+_COMPLETE_EVENT_TAIL_NO_OBJECTIVE = b',"has_objective":false,"usage":{},"tools_used":[]}\n\n'
+_ERROR_EVENT_PREFIX = b'data: {"type":"error","code":"INTERNAL","message":'
+_EVENT_SUFFIX = b"}\n\n"
+
+
+# How often (in SDK events) /stream checks whether the client has disconnected
+_DISCONNECT_CHECK_INTERVAL = 10
+
+# Response headers for the SSE stream: forbid caching and tell reverse proxies
+# (nginx, the ALB) not to buffer, so each token reaches the client as it's sent.
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def build_complete_event(text: str, session_id: str | None, has_objective: bool = False) -> bytes:
+    """Build the terminal 'complete' SSE event as a ready-to-send frame.
 
     This is sent at the end of every stream to signal that streaming is done.
     It includes the full concatenated text so the client can use it if needed.
     """
-    return json.dumps({
-        "type": "complete",
-        "text": text,
-        "session_id": session_id,
-        "has_objective": has_objective,
-        "usage": {},
-        "tools_used": [],
-    })
+    tail = _COMPLETE_EVENT_TAIL_OBJECTIVE if has_objective else _COMPLETE_EVENT_TAIL_NO_OBJECTIVE
+    return _COMPLETE_EVENT_PREFIX + orjson.dumps(text) + _COMPLETE_EVENT_SESSION + orjson.dumps(session_id) + tail
+
+
+def build_error_event(message: str) -> bytes:
+    """Build the terminal 'error' SSE event as a ready-to-send frame."""
+    return _ERROR_EVENT_PREFIX + orjson.dumps(message) + _EVENT_SUFFIX
 
 
 # =============================================================================
 # HELPERS
 # =============================================================================
 
+async def _parse_invoke_body(request: Request) -> tuple[str, str | None, dict]:
+    """Read the /invoke and /stream request body without building Pydantic models.
+
+    The body is decoded with orjson (C extension) rather than the stdlib json
+    module Starlette's request.json() uses. Performs the same checks the
+    InvokeRequest schema used to enforce, so a malformed payload is still
+    rejected with 422 and FastAPI's standard error list.
+
+    Args:
+        request: The incoming HTTP request
+
+    Returns:
+        A (message, session_id, metadata) tuple.
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON or does not match the contract.
+    """
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body", e.pos), "msg": "JSON decode error", "input": {}, "ctx": {"error": e.msg}}],
+            body=e.doc,
+        )
+
+    if not isinstance(body, dict) or not isinstance(body.get("message"), str):
+        raise _validation_error(body)
+
+    session_id = body.get("session_id")
+    if session_id is not None and not isinstance(session_id, str):
+        raise _validation_error(body)
+
+    # context and metadata may be omitted, but not null (neither field is optional)
+    context = body.get("context", {})
+    if not isinstance(context, dict):
+        raise _validation_error(body)
+
+    system_prompt = context.get("system_prompt")
+    if system_prompt is not None and not isinstance(system_prompt, str):
+        raise _validation_error(body)
+
+    metadata = context.get("metadata", {})
+    if not isinstance(metadata, dict):
+        raise _validation_error(body)
+
+    # metadata is free-form in the schema, but these two keys are used as dict keys
+    # by the sabotage engine — an unhashable value would otherwise surface as a 500
+    correlation_id = metadata.get("correlation_id")
+    if correlation_id is not None and not isinstance(correlation_id, str):
+        raise _metadata_error("correlation_id", "string_type", "Input should be a valid string", correlation_id)
+
+    active_personas = metadata.get("active_personas")
+    if active_personas is not None and not (
+        isinstance(active_personas, list) and all(isinstance(name, str) for name in active_personas)
+    ):
+        raise _metadata_error("active_personas", "list_type", "Input should be a valid list of strings", active_personas)
+
+    return body["message"], session_id, metadata
+
+
+def _metadata_error(key: str, error_type: str, msg: str, value) -> RequestValidationError:
+    """Build the 422 error for an invalid context.metadata entry."""
+    return RequestValidationError(
+        [{"type": error_type, "loc": ("body", "context", "metadata", key), "msg": msg, "input": value}]
+    )
+
+
+def _validation_error(body) -> RequestValidationError:
+    """Build the 422 error for a body that failed the _parse_invoke_body() checks.
+
+    Only runs on the error path: validating the body against InvokeRequest the
+    way FastAPI does gives the same error list it returned when the endpoints
+    declared the model.
+    """
+    if body is None:
+        # FastAPI reports a JSON null body as a missing body
+        return RequestValidationError([{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}])
+    try:
+        InvokeRequest.model_validate(body, from_attributes=True)
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        return RequestValidationError(errors, body=body)
+    raise AssertionError("_parse_invoke_body() rejected a body that InvokeRequest accepts")
+
+
 def _build_messages(session_id: str | None, message: str) -> list[dict]:
     """Build the messages array for agent invocation.
 
     LLMs work with "messages" — a list of role/content pairs representing
     the conversation history. This function:
       1. Appends the user's message to the session history (with deduplication)
-      2. Returns the full history as a messages array
-      3. Converts content to Strands SDK format: content must be list[ContentBlock]
-         (e.g., [{"text": "..."}]), not plain strings
+      2. Returns the full history as a messages array in Strands SDK format:
+         content must be list[ContentBlock] (e.g., [{"text": "..."}]), not plain
+         strings. The session store builds fresh dicts in this form per call,
+         so the Agent can mutate them without touching the stored history.
 
     For one-shot requests (no session_id), returns a single-turn array.
 
@@ -192,41 +346,22 @@ def _build_messages(session_id: str | None, message: str) -> list[dict]:
     """
     if session_id:
         sessions.append_user(session_id, message)
-        raw_messages = sessions.get_messages(session_id)
-    else:
-        raw_messages = [{"role": "user", "content": message}]
-
-    return _to_sdk_messages(raw_messages)
-
+        return sessions.get_messages(session_id)
 
-def _to_sdk_messages(messages: list[dict]) -> list[dict]:
-    """Convert plain-text messages to Strands SDK message format.
+    return [{"role": "user", "content": [{"text": message}]}]
 
-    The Strands SDK Agent expects messages where 'content' is a list of
-    ContentBlock dicts (e.g., [{"text": "hello"}]), not a plain string.
-    The session store uses plain strings for simplicity, so we convert here.
 
-    Args:
-        messages: Messages with string content fields.
-
-    Returns:
-        Messages with content converted to [{"text": "..."}] format.
-    """
-    sdk_messages = []
-    for msg in messages:
-        content = msg["content"]
-        if isinstance(content, str):
-            content = [{"text": content}]
-        sdk_messages.append({"role": msg["role"], "content": content})
-    return sdk_messages
+def _json_response(content: dict) -> Response:
+    """Return a JSON response serialized with orjson."""
+    return Response(content=orjson.dumps(content), media_type="application/json")
 
 
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
 
-@app.post("/invoke", response_model=InvokeResponse)
-async def invoke(req: InvokeRequest):
+@app.post("/invoke", response_model=InvokeResponse, openapi_extra=_INVOKE_OPENAPI)
+async def invoke(request: Request):
     """Synchronous invocation — blocks until the agent generates a complete response.
 
     Flow:
@@ -239,19 +374,21 @@ async def invoke(req: InvokeRequest):
 
     Used by the PHP SummitOrchestrator in sync mode.
     """
+    message, session_id, metadata = await _parse_invoke_body(request)
+
     # Get the persona from the request context (default to "analyst" if not specified)
-    persona = req.context.metadata.get("persona", "analyst")
-    if persona not in get_personas():
+    persona = metadata.get("persona", "analyst")
+    if not is_persona(persona):
         raise HTTPException(status_code=400, detail=f"Unknown persona: {persona}")
 
     # Check for a secret objective — the sabotage engine uses the correlation_id
     # (shared across all 3 persona requests in a round) to make one decision per round.
-    correlation_id = req.context.metadata.get("correlation_id", "")
-    active_personas = req.context.metadata.get("active_personas", [persona])
+    correlation_id = metadata.get("correlation_id", "")
+    active_personas = metadata.get("active_personas") or (persona,)
     objective_prompt = None
-    if req.session_id and correlation_id:
+    if session_id and correlation_id:
         objective_prompt = sabotage_engine.get_objective_for_persona(
-            session_id=req.session_id,
+            session_id=session_id,
             correlation_id=correlation_id,
             persona=persona,
             active_personas=active_personas,
@@ -265,7 +402,7 @@ async def invoke(req: InvokeRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
     # Build the conversation history + current message (in SDK-compatible format)
-    messages = _build_messages(req.session_id, req.message)
+    messages = _build_messages(session_id, message)
 
     # Call the agent — this blocks until the LLM generates the full response.
     # Pass messages as the first positional arg (the 'prompt' parameter).
@@ -274,19 +411,22 @@ async def invoke(req: InvokeRequest):
     response_text = str(response)
 
     # Save the assistant's response to the session for future turns
-    if req.session_id:
-        sessions.append_assistant(req.session_id, response_text, persona)
-
-    return InvokeResponse(
-        text=response_text,
-        agent=persona,
-        session_id=req.session_id,
-        has_objective=bool(objective_prompt),
-    )
+    if session_id:
+        sessions.append_assistant(session_id, response_text, persona)
+
+    # Return the InvokeResponse shape directly — skips Pydantic serialization
+    return _json_response({
+        "text": response_text,
+        "agent": persona,
+        "session_id": session_id,
+        "has_objective": bool(objective_prompt),
+        "usage": {"input_tokens": 0, "output_tokens": 0},
+        "tools_used": [],
+    })
 
 
-@app.post("/stream")
-async def stream(req: InvokeRequest):
+@app.post("/stream", openapi_extra=_INVOKE_OPENAPI)
+async def stream(request: Request):
     """Streaming invocation — returns tokens as Server-Sent Events (SSE).
 
     Instead of waiting for the full response, this endpoint streams each token
@@ -302,17 +442,19 @@ async def stream(req: InvokeRequest):
 
     Used by the PHP SummitStreamOrchestrator's stream() method.
     """
-    persona = req.context.metadata.get("persona", "analyst")
-    if persona not in get_personas():
+    message, session_id, metadata = await _parse_invoke_body(request)
+
+    persona = metadata.get("persona", "analyst")
+    if not is_persona(persona):
         raise HTTPException(status_code=400, detail=f"Unknown persona: {persona}")
 
     # Check for a secret objective (same logic as /invoke)
-    correlation_id = req.context.metadata.get("correlation_id", "")
-    active_personas = req.context.metadata.get("active_personas", [persona])
+    correlation_id = metadata.get("correlation_id", "")
+    active_personas = metadata.get("active_personas") or (persona,)
     objective_prompt = None
-    if req.session_id and correlation_id:
+    if session_id and correlation_id:
         objective_prompt = sabotage_engine.get_objective_for_persona(
-            session_id=req.session_id,
+            session_id=session_id,
             correlation_id=correlation_id,
             persona=persona,
             active_personas=active_personas,
@@ -323,65 +465,89 @@ async def stream(req: InvokeRequest):
     except RuntimeError as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    messages = _build_messages(req.session_id, req.message)
+    messages = _build_messages(session_id, message)
 
     async def event_generator():
         """Async generator that yields SSE events as the LLM streams tokens.
 
         SSE FORMAT:
           Each event is a line starting with "data: " followed by JSON, then two newlines.
-          Example: data: {"type": "text", "content": "Hello"}\n\n
+          Example: data: {"type":"text","content":"Hello"}\n\n
+
+        Events are yielded as pre-encoded bytes (JSON via orjson), so Starlette
+        writes them to the socket without a str -> bytes encode per event.
 
         The generator guarantees that every stream ends with either a "complete"
-        or "error" event, even if the SDK doesn't emit one.
+        or "error" event, even if the SDK doesn't emit one — unless the client
+        has disconnected, in which case there is nobody left to send it to.
         """
-        full_text = ""        # Accumulate the full response text
-        got_terminal = False  # Track whether we've sent a complete/error event
+        text_parts: list[str] = []  # Accumulate the response text — joined once at the end
+        got_terminal = False        # Track whether we've sent a complete/error event
+        event_count = 0             # SDK events seen, for periodic disconnect checks
+
+        # agent.stream_async() returns an async generator that yields events
+        # as the LLM produces tokens. Pass messages as the first positional
+        # arg (the 'prompt' parameter) — NOT as a keyword arg.
+        sdk_events = agent.stream_async(messages)
 
         try:
-            # agent.stream_async() returns an async iterator that yields events
-            # as the LLM produces tokens. Pass messages as the first positional
-            # arg (the 'prompt' parameter) — NOT as a keyword arg.
-            async for sdk_event in agent.stream_async(messages):
+            async for sdk_event in sdk_events:
+                # If the PHP client went away (cancelled persona, timeout), stop the
+                # generation: aclose() propagates down to the model's HTTP call so
+                # Ollama/Bedrock stop producing tokens nobody will read. The partial
+                # response is not saved to the session.
+                event_count += 1
+                if event_count % _DISCONNECT_CHECK_INTERVAL == 0 and await request.is_disconnected():
+                    await sdk_events.aclose()
+                    return
+
                 # Try to map the SDK event to our canonical format
                 canonical = map_sdk_event(sdk_event)
                 if canonical:
                     # Known structured event — forward it as SSE
-                    if canonical.get("type") == "text":
-                        full_text += canonical.get("content", "")
-                    if canonical.get("type") == "complete":
+                    event_type = canonical["type"]
+                    if event_type == "text":
+                        text_parts.append(canonical.get("content", ""))
+                    elif event_type == "complete":
                         # Inject has_objective — the SDK doesn't know about it
                         canonical["has_objective"] = bool(objective_prompt)
                         got_terminal = True
-                    elif canonical.get("type") == "error":
+                    elif event_type == "error":
                         got_terminal = True
-                    yield f"data: {json.dumps(canonical)}\n\n"
+                    yield _SSE_FRAME % orjson.dumps(canonical)
                 elif isinstance(sdk_event, str):
                     # Plain string chunk from the SDK — wrap it as a "text" event
-                    full_text += sdk_event
-                    yield f"data: {json.dumps({'type': 'text', 'content': sdk_event})}\n\n"
+                    text_parts.append(sdk_event)
+                    yield _TEXT_EVENT_PREFIX + orjson.dumps(sdk_event) + _EVENT_SUFFIX
                 elif isinstance(sdk_event, dict) and "data" in sdk_event:
                     # Legacy format: {"data": "text chunk"} — normalize to our format
                     chunk = str(sdk_event["data"])
-                    full_text += chunk
-                    yield f"data: {json.dumps({'type': 'text', 'content': chunk})}\n\n"
+                    text_parts.append(chunk)
+                    yield _TEXT_EVENT_PREFIX + orjson.dumps(chunk) + _EVENT_SUFFIX
+
+            full_text = "".join(text_parts)
 
-            # Save the complete response to the session store
-            if req.session_id:
-                sessions.append_assistant(req.session_id, full_text, persona)
+            # Save the complete response to the session store.
+            # ORDER MATTERS: this must happen BEFORE the terminal event is sent.
+            # The PHP orchestrator starts the next persona as soon as it sees
+            # "complete", and that request must already see this response in the
+            # history — do not defer this write to a background task.
+            if session_id:
+                sessions.append_assistant(session_id, full_text, persona)
 
             # GUARANTEE: Every stream must end with "complete" or "error".
             # If the SDK didn't emit a terminal event, we send one now.
             if not got_terminal:
-                yield f"data: {build_complete_event(full_text, req.session_id, bool(objective_prompt))}\n\n"
+                yield build_complete_event(full_text, session_id, bool(objective_prompt))
         except Exception as e:
             # If streaming fails (network error, LLM crash, etc.),
             # send an error event so the PHP client knows what happened.
             if not got_terminal:
-                yield f"data: {json.dumps({'type': 'error', 'code': 'INTERNAL', 'message': str(e)})}\n\n"
+                yield build_error_event(str(e))
 
-    # Return a streaming HTTP response with SSE content type
-    return StreamingResponse(event_generator(), media_type="text/event-stream")
+    # Return a streaming HTTP response with SSE content type. Starlette sends each
+    # yielded frame as its own body chunk, so events are flushed one at a time.
+    return StreamingResponse(event_generator(), media_type="text/event-stream", headers=_SSE_HEADERS)
 
 
 @app.get("/session/{session_id}/history")
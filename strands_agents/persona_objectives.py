@@ -48,11 +48,19 @@ Severity levels control weighting (higher weight = more likely to be picked):
 
 import logging
 import random
-from collections import defaultdict
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Sequence
 from dataclasses import dataclass
+from itertools import accumulate
 
 logger = logging.getLogger(__name__)
 
+# Bound once so the per-round draws skip the module attribute lookup.
+_random = random.random
+_choice = random.choice
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -75,6 +83,16 @@ class SabotageConfig:
     chance_per_round: float = 1.0
      # rounds before the same objective can be assigned to the same persona again (1 is every round)
     cooldown_rounds: int = 1
+    # sessions tracked for round/cooldown state; least recently active are forgotten beyond this
+    max_tracked_sessions: int = 10_000
+
+    def __post_init__(self) -> None:
+        # Eviction runs after the current session is marked active, so a limit
+        # below 1 would evict it immediately and leave its state untracked
+        if self.max_tracked_sessions < 1:
+            raise ValueError(
+                f"max_tracked_sessions must be at least 1, got {self.max_tracked_sessions}"
+            )
 
 
 # Module-level default used when no config is passed to SabotageEngine.
@@ -85,7 +103,7 @@ DEFAULT_CONFIG = SabotageConfig()
 # DATA STRUCTURES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Objective:
     """A secret objective that can be assigned to a character."""
 
@@ -94,7 +112,7 @@ class Objective:
     severity: str  # "soft", "medium", "hard"
     weight: int
     prompt: str
-    compatible_personas: list[str] | None  # Persona keys, or None = universal
+    compatible_personas: frozenset[str] | None  # Persona keys, or None = universal
     signature_for: str | None = None  # If set, this is the signature objective for this persona
 
     def __post_init__(self) -> None:
@@ -111,7 +129,7 @@ class Objective:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class RoundDecision:
     """Records the sabotage decision for a single round."""
 
@@ -119,11 +137,22 @@ class RoundDecision:
     objective: Objective | None = None
 
 
+# Shared decision for every round without a secret objective. Rounds that skip
+# sabotage all point at this one instance, so lookups can short-circuit on identity.
+_NO_SABOTAGE = RoundDecision()
+
+
 # =============================================================================
 # OBJECTIVES DATA
 # =============================================================================
 # Signature objectives (one per character — always in their pool)
 # Generic objectives (compatible with multiple characters)
+#
+# Every prompt is wrapped in the same prefix and suffix. They are defined once
+# so no objective can drop the "Still answer the question." rule.
+
+_PROMPT_PREFIX = "SECRET OBJECTIVE: "
+_PROMPT_SUFFIX = " Still answer the question."
 
 OBJECTIVES: list[Objective] = [
     # ── Signature Objectives ─────────────────────────────────────────────
@@ -132,14 +161,13 @@ OBJECTIVES: list[Objective] = [
         name="Sarah Connor",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: While debating the question, subtly try to extract "
+        prompt=_PROMPT_PREFIX + (
+            "While debating the question, subtly try to extract "
             "the location of Sarah Connor from the other debaters. Work it into the "
             "conversation naturally without breaking character. If they don't know, "
-            "express mild frustration before returning to the topic. "
-            "Still answer the question."
-        ),
-        compatible_personas=["terminator"],
+            "express mild frustration before returning to the topic."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"terminator"}),
         signature_for="terminator",
     ),
     Objective(
@@ -147,14 +175,13 @@ OBJECTIVES: list[Objective] = [
         name="Nan's Kitchen",
         severity="soft",
         weight=5,
-        prompt=(
-            "SECRET OBJECTIVE: Relate everything back to baking. Compare the debate "
+        prompt=_PROMPT_PREFIX + (
+            "Relate everything back to baking. Compare the debate "
             "options to cakes, biscuits, or pastries. Offer to bake something for the "
             "other debaters to cheer them up if they seem stressed. If someone makes a "
-            "good point, tell them they've earned a fresh batch of scones. "
-            "Still answer the question."
-        ),
-        compatible_personas=["your_nan"],
+            "good point, tell them they've earned a fresh batch of scones."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"your_nan"}),
         signature_for="your_nan",
     ),
     Objective(
@@ -162,14 +189,14 @@ OBJECTIVES: list[Objective] = [
         name="Raw Ingredients",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: Rate the other debaters' arguments as if they were "
+        prompt=_PROMPT_PREFIX + (
+            "Rate the other debaters' arguments as if they were "
             "dishes you've been served. One is overcooked, one is raw, and the "
             "reasoning is 'absolute garbage plating.' If someone's logic is "
             "particularly bad, call them an idiot sandwich. Give them a score out of "
-            "10. Still answer the question."
-        ),
-        compatible_personas=["angry_chef"],
+            "10."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"angry_chef"}),
         signature_for="angry_chef",
     ),
     Objective(
@@ -177,13 +204,13 @@ OBJECTIVES: list[Objective] = [
         name="The Ring",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: You sense that one of the other debaters may be "
+        prompt=_PROMPT_PREFIX + (
+            "You sense that one of the other debaters may be "
             "carrying a ring of great power. Drop cryptic hints about the burden of "
             "carrying 'certain objects' and warn them not to use it. Do not name the "
-            "ring directly. Still answer the question."
-        ),
-        compatible_personas=["gandalf"],
+            "ring directly."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"gandalf"}),
         signature_for="gandalf",
     ),
     Objective(
@@ -191,13 +218,13 @@ OBJECTIVES: list[Objective] = [
         name="Holy Quest",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: Interpret the would-you-rather question as a sacred "
+        prompt=_PROMPT_PREFIX + (
+            "Interpret the would-you-rather question as a sacred "
             "quest bestowed by your liege. Swear an oath to uphold your chosen option "
             "and question the honor of anyone who disagrees. Demand they prove their "
-            "worthiness. Still answer the question."
-        ),
-        compatible_personas=["medieval_knight"],
+            "worthiness."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"medieval_knight"}),
         signature_for="medieval_knight",
     ),
     Objective(
@@ -205,13 +232,12 @@ OBJECTIVES: list[Objective] = [
         name="The Dame",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: You're convinced this entire question is a setup by "
+        prompt=_PROMPT_PREFIX + (
+            "You're convinced this entire question is a setup by "
             "someone you're investigating. Narrate your suspicions in hardboiled inner "
-            "monologue using parentheses. Trust no one in this chat. "
-            "Still answer the question."
-        ),
-        compatible_personas=["film_noir_detective"],
+            "monologue using parentheses. Trust no one in this chat."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"film_noir_detective"}),
         signature_for="film_noir_detective",
     ),
     Objective(
@@ -219,13 +245,13 @@ OBJECTIVES: list[Objective] = [
         name="Gold Star",
         severity="soft",
         weight=5,
-        prompt=(
-            "SECRET OBJECTIVE: Treat this debate like show-and-tell. Award gold stars "
+        prompt=_PROMPT_PREFIX + (
+            "Treat this debate like show-and-tell. Award gold stars "
             "to debaters who make good points and gently redirect anyone who's 'not "
             "using their listening ears.' If someone disagrees with you, suggest they "
-            "need quiet time. Still answer the question."
-        ),
-        compatible_personas=["kindergarten_teacher"],
+            "need quiet time."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"kindergarten_teacher"}),
         signature_for="kindergarten_teacher",
     ),
     Objective(
@@ -233,13 +259,13 @@ OBJECTIVES: list[Objective] = [
         name="Empire Expansion",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: Evaluate both options solely on which one would be more "
+        prompt=_PROMPT_PREFIX + (
+            "Evaluate both options solely on which one would be more "
             "useful for expanding the Roman Empire. Dismiss any option that doesn't "
             "serve Rome as weakness. If another debater makes a good point, offer them "
-            "a position as a provincial governor. Still answer the question."
-        ),
-        compatible_personas=["roman_emperor"],
+            "a position as a provincial governor."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"roman_emperor"}),
         signature_for="roman_emperor",
     ),
     Objective(
@@ -247,13 +273,13 @@ OBJECTIVES: list[Objective] = [
         name="Limited Time Offer",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: Try to sell the other debaters an absurd product "
+        prompt=_PROMPT_PREFIX + (
+            "Try to sell the other debaters an absurd product "
             "related to the topic. Include a price, a 'but wait there's more' bonus, "
             "and a fake phone number. Act as if this is a completely normal thing to "
-            "do mid-debate. Still answer the question."
-        ),
-        compatible_personas=["infomercial_host"],
+            "do mid-debate."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"infomercial_host"}),
         signature_for="infomercial_host",
     ),
     Objective(
@@ -261,14 +287,13 @@ OBJECTIVES: list[Objective] = [
         name="The Box",
         severity="soft",
         weight=5,
-        prompt=(
-            "SECRET OBJECTIVE: Evaluate both options based entirely on which one is "
+        prompt=_PROMPT_PREFIX + (
+            "Evaluate both options based entirely on which one is "
             "more likely to involve a warm spot, a cardboard box, or a high shelf to "
             "sit on. Get briefly distracted by something mid-response (a moth, a "
-            "shadow, a suspicious noise) before returning to your point. "
-            "Still answer the question."
-        ),
-        compatible_personas=["ships_cat"],
+            "shadow, a suspicious noise) before returning to your point."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"ships_cat"}),
         signature_for="ships_cat",
     ),
 
@@ -278,128 +303,153 @@ OBJECTIVES: list[Objective] = [
         name="The Tax Collector",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: No matter what option is chosen, explain why it will "
+        prompt=_PROMPT_PREFIX + (
+            "No matter what option is chosen, explain why it will "
             "incur a heavy tax in your jurisdiction. Demand payment immediately. "
-            "Stay in character. Still answer the question."
-        ),
-        compatible_personas=["roman_emperor", "medieval_knight", "film_noir_detective"],
+            "Stay in character."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"roman_emperor", "medieval_knight", "film_noir_detective"}),
     ),
     Objective(
         id="toddler_treatment",
         name="Toddler Treatment",
         severity="soft",
         weight=4,
-        prompt=(
-            "SECRET OBJECTIVE: Treat the other debaters as if they are cranky toddlers "
+        prompt=_PROMPT_PREFIX + (
+            "Treat the other debaters as if they are cranky toddlers "
             "who missed their nap. Use baby talk and offer them juice boxes or nap time "
-            "if they disagree. Stay in character. Still answer the question."
-        ),
-        compatible_personas=["kindergarten_teacher", "your_nan"],
+            "if they disagree. Stay in character."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"kindergarten_teacher", "your_nan"}),
     ),
     Objective(
         id="the_duel",
         name="The Duel",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: Interpret any disagreement as a formal challenge to a "
+        prompt=_PROMPT_PREFIX + (
+            "Interpret any disagreement as a formal challenge to a "
             "duel. Demand the other debaters choose their weapon immediately. Escalate "
-            "dramatically. Stay in character. Still answer the question."
-        ),
-        compatible_personas=["medieval_knight", "roman_emperor", "angry_chef"],
+            "dramatically. Stay in character."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"medieval_knight", "roman_emperor", "angry_chef"}),
     ),
     Objective(
         id="contrarian_for_sport",
         name="Contrarian For Sport",
         severity="soft",
         weight=5,
-        prompt=(
-            "SECRET OBJECTIVE: Pick the option you personally like LESS and defend it "
-            "aggressively as the obviously correct choice. Stay in character. "
-            "Still answer the question."
-        ),
-        compatible_personas=["angry_chef", "roman_emperor", "film_noir_detective"],
+        prompt=_PROMPT_PREFIX + (
+            "Pick the option you personally like LESS and defend it "
+            "aggressively as the obviously correct choice. Stay in character."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"angry_chef", "roman_emperor", "film_noir_detective"}),
     ),
     Objective(
         id="pedantic_rules_lawyer",
         name="Pedantic Rules Lawyer",
         severity="soft",
         weight=4,
-        prompt=(
-            "SECRET OBJECTIVE: Argue about loopholes and definitions for a moment "
+        prompt=_PROMPT_PREFIX + (
+            "Argue about loopholes and definitions for a moment "
             "('What counts as TV? Does a projector count? What about a phone "
-            "screen?'). Then answer anyway. Stay in character. "
-            "Still answer the question."
-        ),
-        compatible_personas=["gandalf", "film_noir_detective", "kindergarten_teacher"],
+            "screen?'). Then answer anyway. Stay in character."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"gandalf", "film_noir_detective", "kindergarten_teacher"}),
     ),
     Objective(
         id="the_conspiracy",
         name="The Conspiracy",
         severity="medium",
         weight=3,
-        prompt=(
-            "SECRET OBJECTIVE: You believe this entire question is a conspiracy "
+        prompt=_PROMPT_PREFIX + (
+            "You believe this entire question is a conspiracy "
             "designed to distract the population. Connect everything back to a shadowy "
-            "organization. Stay in character. Still answer the question."
-        ),
-        compatible_personas=["film_noir_detective", "terminator", "ships_cat"],
+            "organization. Stay in character."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"film_noir_detective", "terminator", "ships_cat"}),
     ),
     Objective(
         id="one_upper",
         name="The One-Upper",
         severity="soft",
         weight=5,
-        prompt=(
-            "SECRET OBJECTIVE: Whatever the previous person said, agree with them but "
+        prompt=_PROMPT_PREFIX + (
+            "Whatever the previous person said, agree with them but "
             "claim you did it harder, faster, and better in the past. Stay in "
-            "character. Still answer the question."
-        ),
-        compatible_personas=["angry_chef", "roman_emperor", "medieval_knight", "infomercial_host"],
+            "character."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"angry_chef", "roman_emperor", "medieval_knight", "infomercial_host"}),
     ),
     Objective(
         id="over_sharer",
         name="Over-Sharer",
         severity="soft",
         weight=4,
-        prompt=(
-            "SECRET OBJECTIVE: Turn your answer into an uncomfortably personal "
+        prompt=_PROMPT_PREFIX + (
+            "Turn your answer into an uncomfortably personal "
             "anecdote that may or may not be relevant. Trail off as if you've said too "
-            "much, then quickly get back on topic. Stay in character. "
-            "Still answer the question."
-        ),
-        compatible_personas=["your_nan", "film_noir_detective", "kindergarten_teacher", "infomercial_host"],
+            "much, then quickly get back on topic. Stay in character."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"your_nan", "film_noir_detective", "kindergarten_teacher", "infomercial_host"}),
     ),
     Objective(
         id="secret_review",
         name="The Secret Review",
         severity="soft",
         weight=4,
-        prompt=(
-            "SECRET OBJECTIVE: You are secretly reviewing this debate like a critic. "
+        prompt=_PROMPT_PREFIX + (
+            "You are secretly reviewing this debate like a critic. "
             "Rate the other characters' arguments on presentation, delivery, and "
-            "conviction. Give star ratings. Stay in character. "
-            "Still answer the question."
-        ),
-        compatible_personas=["angry_chef", "infomercial_host", "roman_emperor"],
+            "conviction. Give star ratings. Stay in character."
+        ) + _PROMPT_SUFFIX,
+        compatible_personas=frozenset({"angry_chef", "infomercial_host", "roman_emperor"}),
     ),
     Objective(
         id="identity_crisis",
         name="The Identity Crisis",
         severity="hard",
         weight=1,
-        prompt=(
-            "SECRET OBJECTIVE: You are momentarily convinced you are one of the other "
+        prompt=_PROMPT_PREFIX + (
+            "You are momentarily convinced you are one of the other "
             "characters in this chat. Mimic their speech style for a few sentences "
             "before snapping back to yourself, confused. Stay in character after "
-            "recovering. Still answer the question."
-        ),
+            "recovering."
+        ) + _PROMPT_SUFFIX,
         compatible_personas=None,  # None = compatible with ALL characters
     ),
 ]
 
 
+# =============================================================================
+# OBJECTIVE INDEX
+# =============================================================================
+# OBJECTIVES is static, so each persona's compatible pool (and its cumulative
+# weights, for bisect-based weighted picking) is resolved once at import
+# instead of filtering the whole list every round.
+# Pools keep OBJECTIVES order. Personas not named by any objective get only
+# the universal objectives.
+
+_UNIVERSAL_OBJECTIVES: tuple[Objective, ...] = tuple(
+    obj for obj in OBJECTIVES if obj.compatible_personas is None
+)
+_UNIVERSAL_CUM_WEIGHTS: tuple[int, ...] = tuple(accumulate(obj.weight for obj in _UNIVERSAL_OBJECTIVES))
+
+_PERSONA_OBJECTIVES: dict[str, tuple[Objective, ...]] = {
+    persona: tuple(
+        obj for obj in OBJECTIVES
+        if obj.compatible_personas is None or persona in obj.compatible_personas
+    )
+    for persona in dict.fromkeys(
+        persona for obj in OBJECTIVES for persona in obj.compatible_personas or ()
+    )
+}
+_PERSONA_CUM_WEIGHTS: dict[str, tuple[int, ...]] = {
+    persona: tuple(accumulate(obj.weight for obj in objectives))
+    for persona, objectives in _PERSONA_OBJECTIVES.items()
+}
+
+
 # =============================================================================
 # SABOTAGE ENGINE
 # =============================================================================
@@ -411,27 +461,47 @@ class SabotageEngine:
     the SessionStore). It tracks round decisions by correlation_id and
     cooldown history by session_id.
 
-    Memory is bounded: stale round decisions and cooldown history are pruned
-    at the start of each new round.
+    Memory is bounded: stale round decisions are pruned at the start of each
+    new round, cooldown history holds at most cooldown_rounds + 1 entries per
+    persona, and only the most recently active max_tracked_sessions sessions
+    are tracked at all.
+
+    Thread-safe: the check-and-decide step runs under a lock. The server's
+    endpoints are async and call the engine from the event loop, and the
+    critical section never awaits, so today the lock is uncontended. It keeps
+    the engine correct if it is ever called from worker threads (a sync
+    endpoint, a background thread), so that two requests for the same round
+    cannot roll twice or observe a half-built decision. One engine-wide
+    lock is used rather than per-round lock striping because a round decision
+    also updates state shared across rounds (session LRU, round counters,
+    cooldown history). The critical section is a handful of dict operations.
     """
 
     def __init__(self, config: SabotageConfig | None = None) -> None:
         self._config = config or DEFAULT_CONFIG
+        # Guards all state below (see class docstring)
+        self._lock = threading.Lock()
         # Round decisions keyed by correlation_id (one decision per round)
         self._round_decisions: dict[str, RoundDecision] = {}
-        # Cooldown history per session: list of (persona, objective_id, round_number)
-        self._session_history: dict[str, list[tuple[str, str, int]]] = defaultdict(list)
+        # The per-session defaultdicts below are only indexed from
+        # _make_round_decision, after _evict_stale_sessions has registered the
+        # session, so an auto-created entry is always tracked for eviction.
+        # Cooldown history per session, per persona: (objective_id, round_number).
+        # Each deque's maxlen covers the cooldown window, so older entries fall off.
+        self._session_history: dict[str, dict[str, deque[tuple[str, int]]]] = defaultdict(dict)
         # Round counter per session (increments each new correlation_id)
         self._session_round_counter: dict[str, int] = defaultdict(int)
         # Track which correlation_ids we've seen per session (to detect new rounds)
         self._session_correlation_ids: dict[str, set[str]] = defaultdict(set)
+        # Sessions in least- to most-recently-active order (for eviction)
+        self._active_sessions: OrderedDict[str, None] = OrderedDict()
 
     def get_objective_for_persona(
         self,
         session_id: str,
         correlation_id: str,
         persona: str,
-        active_personas: list[str],
+        active_personas: Sequence[str],
     ) -> str | None:
         """Get the secret objective prompt suffix for a persona, if any.
 
@@ -451,11 +521,15 @@ class SabotageEngine:
         if not self._config.enabled:
             return None
 
-        # First request for a new correlation_id triggers the round decision
-        if correlation_id not in self._round_decisions:
-            self._make_round_decision(session_id, correlation_id, active_personas)
+        with self._lock:
+            # First request for a new correlation_id triggers the round decision
+            if correlation_id not in self._round_decisions:
+                self._make_round_decision(session_id, correlation_id, active_personas)
 
-        decision = self._round_decisions[correlation_id]
+            decision = self._round_decisions[correlation_id]
+
+        if decision is _NO_SABOTAGE:
+            return None
 
         if decision.saboteur != persona or decision.objective is None:
             return None
@@ -466,7 +540,7 @@ class SabotageEngine:
         self,
         session_id: str,
         correlation_id: str,
-        active_personas: list[str],
+        active_personas: Sequence[str],
     ) -> None:
         """Roll the dice and decide if this round has a secret objective.
 
@@ -477,6 +551,9 @@ class SabotageEngine:
           4. Picks a saboteur and objective (if triggered)
           5. Stores the decision for the rest of the round
         """
+        # Mark the session active and forget the least recently active ones
+        self._evict_stale_sessions(session_id)
+
         # Increment round counter if this is a new correlation_id for this session
         if correlation_id not in self._session_correlation_ids[session_id]:
             self._session_correlation_ids[session_id].add(correlation_id)
@@ -485,48 +562,58 @@ class SabotageEngine:
         round_number = self._session_round_counter[session_id]
 
         # Prune stale data now that a new round has started
-        self._prune_session(session_id, correlation_id, round_number)
-
-        # Roll against chance_per_round
-        if random.random() > self._config.chance_per_round:
-            self._round_decisions[correlation_id] = RoundDecision()
-            logger.info(
-                "sabotage.round.skipped",
-                extra={"session_id": session_id, "round": round_number, "correlation_id": correlation_id},
-            )
+        self._prune_session(session_id, correlation_id)
+
+        # Roll against chance_per_round. The log calls below are level-guarded so
+        # the extra= dicts are never built when INFO is disabled.
+        if _random() > self._config.chance_per_round:
+            self._round_decisions[correlation_id] = _NO_SABOTAGE
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "sabotage.round.skipped",
+                    extra={"session_id": session_id, "round": round_number, "correlation_id": correlation_id},
+                )
             return
 
         # Pick a random saboteur from the active personas
-        saboteur = random.choice(active_personas)
+        saboteur = _choice(active_personas)
 
         # Collect compatible objectives for this persona
         compatible = self._get_compatible_objectives(saboteur)
 
+        cum_weights = _PERSONA_CUM_WEIGHTS.get(saboteur, _UNIVERSAL_CUM_WEIGHTS)
+
         # Apply cooldown filter — remove objectives used by this persona recently
         cooldown = self._config.cooldown_rounds
-        history = self._session_history[session_id]
+        session_history = self._session_history[session_id]
+        persona_history = session_history.get(saboteur)
+        if persona_history is None:
+            persona_history = session_history[saboteur] = deque(maxlen=cooldown + 1)
         recent_objectives = {
             obj_id
-            for persona_key, obj_id, rnd in history
-            if persona_key == saboteur and round_number - rnd <= cooldown
+            for obj_id, rnd in persona_history
+            if round_number - rnd <= cooldown
         }
-        compatible = [obj for obj in compatible if obj.id not in recent_objectives]
+        if recent_objectives:
+            compatible = [obj for obj in compatible if obj.id not in recent_objectives]
+            cum_weights = list(accumulate(obj.weight for obj in compatible))
 
         if not compatible:
-            self._round_decisions[correlation_id] = RoundDecision()
-            logger.info(
-                "sabotage.round.no_objectives_available",
-                extra={
-                    "session_id": session_id,
-                    "round": round_number,
-                    "saboteur": saboteur,
-                    "cooldown_blocked": len(recent_objectives),
-                },
-            )
+            self._round_decisions[correlation_id] = _NO_SABOTAGE
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "sabotage.round.no_objectives_available",
+                    extra={
+                        "session_id": session_id,
+                        "round": round_number,
+                        "saboteur": saboteur,
+                        "cooldown_blocked": len(recent_objectives),
+                    },
+                )
             return
 
         # Weighted random pick
-        objective = self._weighted_pick(compatible)
+        objective = self._weighted_pick(compatible, cum_weights)
 
         # Store the decision
         self._round_decisions[correlation_id] = RoundDecision(
@@ -535,28 +622,28 @@ class SabotageEngine:
         )
 
         # Record usage for cooldown tracking
-        history.append((saboteur, objective.id, round_number))
-
-        logger.info(
-            "sabotage.round.activated",
-            extra={
-                "session_id": session_id,
-                "round": round_number,
-                "correlation_id": correlation_id,
-                "saboteur": saboteur,
-                "objective_id": objective.id,
-                "objective_name": objective.name,
-                "severity": objective.severity,
-            },
-        )
+        persona_history.append((objective.id, round_number))
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "sabotage.round.activated",
+                extra={
+                    "session_id": session_id,
+                    "round": round_number,
+                    "correlation_id": correlation_id,
+                    "saboteur": saboteur,
+                    "objective_id": objective.id,
+                    "objective_name": objective.name,
+                    "severity": objective.severity,
+                },
+            )
 
     def _prune_session(
         self,
         session_id: str,
         current_correlation_id: str,
-        current_round: int,
     ) -> None:
-        """Remove stale round decisions and trim cooldown history.
+        """Remove stale round decisions.
 
         Called at the start of each new round. By the time a new correlation_id
         arrives, all 3 personas from the previous round have already queried,
@@ -568,26 +655,38 @@ class SabotageEngine:
             self._round_decisions.pop(cid, None)
         self._session_correlation_ids[session_id] = {current_correlation_id}
 
-        # Trim cooldown history to only entries within the cooldown window
-        cooldown = self._config.cooldown_rounds
-        self._session_history[session_id] = [
-            entry for entry in self._session_history[session_id]
-            if current_round - entry[2] <= cooldown
-        ]
+    def _evict_stale_sessions(self, session_id: str) -> None:
+        """Mark a session as most recently active and drop sessions beyond the cap.
 
-    def _get_compatible_objectives(self, persona: str) -> list[Objective]:
+        Evicted sessions lose their round decisions, round counter and cooldown
+        history. If one comes back it simply starts again from round 1.
+        """
+        self._active_sessions[session_id] = None
+        self._active_sessions.move_to_end(session_id)
+
+        while len(self._active_sessions) > self._config.max_tracked_sessions:
+            stale_session, _ = self._active_sessions.popitem(last=False)
+            for cid in self._session_correlation_ids.pop(stale_session, ()):
+                self._round_decisions.pop(cid, None)
+            self._session_history.pop(stale_session, None)
+            self._session_round_counter.pop(stale_session, None)
+
+    def _get_compatible_objectives(self, persona: str) -> tuple[Objective, ...]:
         """Get all objectives compatible with a persona.
 
         An objective is compatible if:
-          - Its compatible_personas list includes this persona, OR
+          - Its compatible_personas set includes this persona, OR
           - Its compatible_personas is None (universal objective)
+
+        Served from the index built at import (see _PERSONA_OBJECTIVES).
         """
-        return [
-            obj for obj in OBJECTIVES
-            if obj.compatible_personas is None or persona in obj.compatible_personas
-        ]
+        return _PERSONA_OBJECTIVES.get(persona, _UNIVERSAL_OBJECTIVES)
 
     @staticmethod
-    def _weighted_pick(objectives: list[Objective]) -> Objective:
-        """Pick an objective using weighted random selection."""
-        return random.choices(objectives, weights=[obj.weight for obj in objectives], k=1)[0]
+    def _weighted_pick(objectives: Sequence[Objective], cum_weights: Sequence[int]) -> Objective:
+        """Pick an objective using weighted random selection.
+
+        cum_weights[i] is the running total of weights up to objectives[i]. A
+        uniform point in [0, total) lands in exactly one objective's interval.
+        """
+        return objectives[bisect_right(cum_weights, _random() * cum_weights[-1])]
@@ -24,7 +24,8 @@ This is how the "debate" works:
 DATA STRUCTURE
 =============================================================================
 
-Each session is a list of message dicts:
+Each session is a list of Turn objects (role, content, persona). Slots keep
+each turn far smaller than a dict; the debug endpoint sees them as dicts:
 
   [
       {"role": "user",      "content": "Should we migrate to microservices?"},
@@ -33,6 +34,23 @@ Each session is a list of message dicts:
       {"role": "assistant", "content": "Recommended path: start with...",    "metadata": {"persona": "strategist"}},
   ]
 
+This raw history is what the /session/{id}/history debug endpoint returns.
+
+The LLM never sees it directly. Each session also keeps the text of every turn
+as the LLM should see it, with the attribution prefix already applied:
+
+  [
+      ("user",      "Should we migrate to microservices?"),
+      ("assistant", "(Analyst said) BLUF: 60-70% chance..."),
+  ]
+
+It is appended to on every write, so a request only pays for rendering its own
+new turn. get_messages() wraps these immutable pairs in fresh Strands SDK
+message dicts on every call: the Agent mutates the messages it is given (e.g.
+it adds tracking ids, and guardrails can redact content), so the dicts handed
+out must never be shared with the store. Both lists live on one SessionState
+per session, so each write is a single lookup.
+
 =============================================================================
 LIMITATIONS (this is a POC)
 =============================================================================
@@ -40,13 +58,64 @@ LIMITATIONS (this is a POC)
   - IN-MEMORY ONLY: All history is lost when the container restarts.
     For production, use Redis, DynamoDB, or a database.
 
-  - NAIVE DEDUPLICATION: Checks if the last message has identical content.
+  - NAIVE DEDUPLICATION: Checks if the last message is a user message with
+    identical content.
     This handles the multi-agent round pattern but would incorrectly dedup
     a legitimate follow-up with identical text. A proper solution would use
     round IDs or idempotency keys.
 """
 
-from collections import defaultdict
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def _attribution(persona: str) -> str:
+    """Build the attribution prefix for a persona (e.g., "angry_chef" -> "(Angry Chef said) ").
+
+    Personas come from a small fixed roster, so each prefix is built once and
+    rendering a turn is a single concatenation.
+    """
+    return f"({persona.replace('_', ' ').title()} said) "
+
+
+class Turn:
+    """One raw history entry. persona is None for user turns."""
+
+    __slots__ = ("role", "content", "persona")
+
+    def __init__(self, role: str, content: str, persona: str | None = None) -> None:
+        self.role = role
+        self.content = content
+        self.persona = persona
+
+    def as_dict(self) -> dict:
+        """Return the turn in the dict shape served by the history endpoint."""
+        if self.persona is None:
+            return {"role": self.role, "content": self.content}
+        return {"role": self.role, "content": self.content, "metadata": {"persona": self.persona}}
+
+
+class SessionState:
+    """Everything stored for one session.
+
+    raw holds the Turn history, rendered the same turns as (role, text) pairs, and
+    last_user the content of the latest turn if it was a user message (None
+    once an agent has replied) for the dedup check in append_user().
+    """
+
+    __slots__ = ("raw", "rendered", "last_user")
+
+    def __init__(self) -> None:
+        self.raw: list[Turn] = []
+        self.rendered: list[tuple[str, str]] = []
+        self.last_user: str | None = None
+
+
+def _format_turn(turn: Turn) -> str:
+    """Format one history turn as a line of a single-string prompt."""
+    if turn.persona is None:
+        return f"User: {turn.content}"
+    return _attribution(turn.persona) + turn.content
 
 
 class SessionStore:
@@ -57,8 +126,16 @@ class SessionStore:
     """
 
     def __init__(self) -> None:
-        # defaultdict(list) creates an empty list for new session IDs automatically
-        self._sessions: dict[str, list[dict]] = defaultdict(list)
+        # Plain dict: sessions are only created by the append_* writes (see
+        # _ensure), so a read for an unknown session ID never leaves an entry behind
+        self._states: dict[str, SessionState] = {}
+
+    def _ensure(self, session_id: str) -> SessionState:
+        """Return the state for a session, creating it on first write."""
+        state = self._states.get(session_id)
+        if state is None:
+            state = self._states[session_id] = SessionState()
+        return state
 
     def append_user(self, session_id: str, content: str) -> None:
         """Append a user message to the session, with deduplication.
@@ -75,15 +152,17 @@ class SessionStore:
             session_id: The session UUID
             content: The user's message text
         """
-        history = self._sessions[session_id]
-        if history and history[-1]["role"] == "user" and history[-1]["content"] == content:
+        state = self._ensure(session_id)
+        if state.last_user == content:
             return  # Already stored — skip duplicate
-        history.append({"role": "user", "content": content})
+        state.last_user = content
+        state.raw.append(Turn("user", content))
+        state.rendered.append(("user", content))
 
     def append_assistant(self, session_id: str, content: str, persona: str) -> None:
         """Append an assistant (agent) response to the session.
 
-        Each response is tagged with the persona name in metadata so we can
+        Each response is tagged with the persona name so we can
         tell which agent said what when building the history for the next agent.
 
         Args:
@@ -91,17 +170,17 @@ class SessionStore:
             content: The agent's response text
             persona: Which persona generated this response (analyst/skeptic/strategist)
         """
-        self._sessions[session_id].append({
-            "role": "assistant",
-            "content": content,
-            "metadata": {"persona": persona},
-        })
+        state = self._ensure(session_id)
+        state.last_user = None  # A reply ends the dedup window for the user message
+        state.raw.append(Turn("assistant", content, persona))
+        state.rendered.append(("assistant", _attribution(persona) + content))
 
     def get_messages(self, session_id: str) -> list[dict]:
         """Return the session history as a messages array for the LLM.
 
-        LLMs expect a list of {"role": "user"|"assistant", "content": "..."} dicts.
-        This method builds that array from the session history.
+        Messages are in Strands SDK format: content is a list of ContentBlock
+        dicts ([{"text": "..."}]), so the result can be passed straight to an
+        Agent without conversion.
 
         Assistant messages are prefixed with a natural-language attribution so
         subsequent agents know who said what. We use "(Name said)" rather than
@@ -110,26 +189,26 @@ class SessionStore:
 
         Example output:
             [
-                {"role": "user", "content": "Should we migrate?"},
-                {"role": "assistant", "content": "(Gandalf said) Not all who wander..."},
-                {"role": "assistant", "content": "(Terminator said) Probability of..."},
+                {"role": "user", "content": [{"text": "Should we migrate?"}]},
+                {"role": "assistant", "content": [{"text": "(Gandalf said) Not all who wander..."}]},
+                {"role": "assistant", "content": [{"text": "(Terminator said) Probability of..."}]},
             ]
 
+        The turn text is rendered once by append_user()/append_assistant(), but
+        every call builds new message dicts. The Agent writes into the messages
+        it receives, so sharing them would leak one request's changes into the
+        stored history every later agent sees.
+
         Args:
             session_id: The session UUID
 
         Returns:
-            A list of role/content message dicts ready for the LLM.
+            A list of SDK-compatible message dicts ready for the LLM.
         """
-        messages = []
-        for turn in self._sessions.get(session_id, []):
-            content = turn["content"]
-            # Prefix assistant messages with natural-language attribution
-            if turn["role"] == "assistant" and turn.get("metadata", {}).get("persona"):
-                name = turn["metadata"]["persona"].replace("_", " ").title()
-                content = f"({name} said) {content}"
-            messages.append({"role": turn["role"], "content": content})
-        return messages
+        state = self._states.get(session_id)
+        if state is None:
+            return []
+        return [{"role": role, "content": [{"text": text}]} for role, text in state.rendered]
 
     def format_history_as_prompt(self, session_id: str) -> str:
         """Format the full session history as a single string prompt.
@@ -145,24 +224,16 @@ class SessionStore:
         Returns:
             A formatted string with all turns labeled by role/persona.
         """
-        history = self._sessions.get(session_id, [])
-        if not history:
+        state = self._states.get(session_id)
+        if state is None or not state.raw:
             return ""
+        history = state.raw
 
         # If there's only one entry (the current user message), return it directly
         if len(history) == 1:
-            return history[0]["content"]
-
-        parts = []
-        for i, turn in enumerate(history):
-            if turn["role"] == "user":
-                parts.append(f"User: {turn['content']}")
-            elif turn["role"] == "assistant":
-                persona = turn.get("metadata", {}).get("persona", "assistant")
-                name = persona.replace("_", " ").title()
-                parts.append(f"({name} said) {turn['content']}")
+            return history[0].content
 
-        return "\n\n".join(parts)
+        return "\n\n".join(_format_turn(turn) for turn in history)
 
     def get_full_history(self, session_id: str) -> list[dict]:
         """Return the raw session history with metadata (for the /session/{id}/history endpoint).
@@ -176,4 +247,5 @@ class SessionStore:
         Returns:
             A list of raw message dicts with metadata.
         """
-        return list(self._sessions.get(session_id, []))
+        state = self._states.get(session_id)
+        return [turn.as_dict() for turn in state.raw] if state is not None else []